@@ -3,10 +3,20 @@ Streamlit Frontend for ProspectSearchAgent
 A beautiful web interface to search for B2B prospects
 """
 import streamlit as st
+import pandas as pd
+import csv
+import heapq
+import html
+import io
 import json
+import math
+import operator
 import os
+import orjson
 from pathlib import Path
 import sys
+import threading
+import time
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent))
@@ -22,53 +32,192 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+
+
+@st.cache_resource(show_spinner=False)
+def get_agent(apollo_key: str, crunchbase_key: str, serp_key: str) -> ProspectSearchAgent:
+    """Shared agent per API key set, so HTTP sessions survive reruns"""
+    return ProspectSearchAgent(
+        apollo_api_key=apollo_key if apollo_key else None,
+        crunchbase_api_key=crunchbase_key if crunchbase_key else None,
+        serp_api_key=serp_key if serp_key else None
+    )
+
+
+@st.cache_resource(show_spinner=False)
+def get_agent_lock(apollo_key: str, crunchbase_key: str, serp_key: str) -> threading.Lock:
+    """Lock guarding the shared agent, which keeps per-search ICP state"""
+    return threading.Lock()
+
+
+PROSPECT_TABLE_COLUMNS = ['company_name', 'domain', 'industry', 'revenue', 'employee_count',
+                          'confidence', 'funding_stage', 'location']
+
+
+# Seconds a finished search is reused for an identical ICP and key set
+SEARCH_CACHE_TTL = 3600
+
+
+@st.cache_resource(show_spinner=False)
+def get_search_cache() -> dict:
+    """Finished searches shared across sessions: (icp_json, keys...) -> (finished_at, prospects)"""
+    return {}
+
+
+def run_search(icp_config: dict, apollo_key: str, crunchbase_key: str, serp_key: str,
+               placeholder=None) -> list:
+    """
+    Run a prospect search, reusing the result of an identical recent search
+    
+    Only the final list is cached, never the st.* calls, so a cache hit needs
+    no element replay. On a miss, prospects are shown in placeholder as they
+    arrive.
+    """
+    key = (json.dumps(icp_config, sort_keys=True), apollo_key, crunchbase_key, serp_key)
+    search_cache = get_search_cache()
+    
+    cached = search_cache.get(key)
+    if cached and time.monotonic() - cached[0] < SEARCH_CACHE_TTL:
+        return list(cached[1])
+    
+    agent = get_agent(apollo_key, crunchbase_key, serp_key)
+    found = []
+    
+    with get_agent_lock(apollo_key, crunchbase_key, serp_key):
+        for prospect in agent.search_prospects_stream(icp_config):
+            found.append(prospect)
+            if placeholder is not None:
+                placeholder.dataframe(
+                    pd.DataFrame(found, columns=PROSPECT_TABLE_COLUMNS),
+                    use_container_width=True,
+                    hide_index=True
+                )
+    
+    max_results = icp_config.get("search_params", {}).get("max_results", 50)
+    prospects = heapq.nlargest(max_results, found, key=operator.itemgetter("confidence"))
+    
+    # Drop expired searches before storing this one
+    now = time.monotonic()
+    for stale_key in [k for k, (finished_at, _) in list(search_cache.items())
+                      if now - finished_at >= SEARCH_CACHE_TTL]:
+        search_cache.pop(stale_key, None)
+    search_cache[key] = (now, prospects)
+    
+    return list(prospects)
+
+
+def build_prospects_frame(prospects: list) -> pd.DataFrame:
+    """
+    Columnar view of the search results used for metrics, filtering and display
+    
+    Display fields (domain links, detail card HTML) are formatted here once per
+    search, so filter and page changes only slice the frame.
+    """
+    df = pd.DataFrame(prospects, columns=PROSPECT_TABLE_COLUMNS + ['contacts', 'signals'])
+    df['industry'] = df['industry'].fillna('Unknown')
+    df['has_funding'] = df['signals'].map(lambda s: bool((s or {}).get('new_funding')))
+    df['domain_url'] = df['domain'].map(lambda d: f"https://{d}" if d else None)
+    df['card_html'] = [prospect_card_html(p) for p in prospects]
+    return df
+
+
+@st.cache_data(show_spinner=False)
+def prospects_to_json_bytes(prospects: list) -> bytes:
+    """Serialize prospects for the JSON download, once per result set"""
+    return orjson.dumps(prospects, default=str, option=orjson.OPT_INDENT_2)
+
+
+@st.cache_data(show_spinner=False)
+def prospects_to_csv_bytes(prospects: list) -> bytes:
+    """Serialize prospects for the CSV download, once per result set"""
+    csv_buffer = io.StringIO()
+    fieldnames = ['company_name', 'domain', 'industry', 'revenue', 'employee_count',
+                  'confidence', 'location', 'funding_stage']
+    writer = csv.DictWriter(csv_buffer, fieldnames=fieldnames, extrasaction='ignore')
+    writer.writeheader()
+    writer.writerows(prospects)
+    return csv_buffer.getvalue().encode("utf-8")
+
+
+def prospect_card_html(prospect: dict) -> str:
+    """Build the HTML for a prospect's detail card"""
+    # Confidence badge
+    confidence = prospect.get('confidence', 0)
+    if confidence >= 0.8:
+        conf_class = "confidence-high"
+        conf_icon = "🟢"
+    elif confidence >= 0.6:
+        conf_class = "confidence-medium"
+        conf_icon = "🟡"
+    else:
+        conf_class = "confidence-low"
+        conf_icon = "🔴"
+    
+    revenue = prospect.get('revenue')
+    employees = prospect.get('employee_count')
+    metrics = [
+        ("Revenue", f"${revenue/1000000:.1f}M" if revenue else "N/A"),
+        ("Employees", f"{employees:,}" if employees else "N/A"),
+        ("Funding Stage", prospect.get('funding_stage') or "N/A"),
+        ("Location", prospect.get('location') or "N/A"),
+    ]
+    metrics_html = "".join(
+        f'<div><div class="metric-label">{label}</div>'
+        f'<div class="metric-value">{html.escape(str(value))}</div></div>'
+        for label, value in metrics
+    )
+    
+    # Signals
+    signals = prospect.get('signals', {})
+    signal_badges = []
+    
+    if signals.get('new_funding'):
+        signal_badges.append("🚀 New Funding")
+    if signals.get('recent_hiring'):
+        signal_badges.append("👥 Hiring")
+    if signals.get('data_roles_count', 0) > 0:
+        signal_badges.append(f"📊 {signals.get('data_roles_count')} Data Roles")
+    
+    parts = [
+        '<div class="prospect-card">',
+        f"<h3>{html.escape(prospect.get('company_name') or 'Unknown')}</h3>",
+        f"<p>🌐 {html.escape(prospect.get('domain') or 'N/A')} | "
+        f"🏢 {html.escape(prospect.get('industry') or 'N/A')} | "
+        f"{conf_icon} <span class='{conf_class}'>{confidence:.0%} Match</span></p>",
+        f'<div class="metrics-grid">{metrics_html}</div>',
+    ]
+    
+    if prospect.get('description'):
+        parts.append(f"<p><b>Description:</b> {html.escape(prospect['description'])}</p>")
+    
+    if signal_badges:
+        parts.append("<p><b>Signals:</b> " + " | ".join(signal_badges) + "</p>")
+    
+    sources = prospect.get('source', [])
+    if sources:
+        parts.append(f"<small><b>Data Sources:</b> {html.escape(', '.join(sources))}</small>")
+    
+    parts.append("</div>")
+    return "".join(parts)
+
+
 # Custom CSS
-st.markdown("""
-<style>
-    .main-header {
-        font-size: 3rem;
-        color: #1E88E5;
-        text-align: center;
-        margin-bottom: 1rem;
-    }
-    .sub-header {
-        text-align: center;
-        color: #666;
-        margin-bottom: 2rem;
-    }
-    .metric-card {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        padding: 20px;
-        border-radius: 10px;
-        color: white;
-        text-align: center;
-    }
-    .prospect-card {
-        border: 1px solid #e0e0e0;
-        border-radius: 10px;
-        padding: 20px;
-        margin: 10px 0;
-        background: white;
-        box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-    }
-    .confidence-high {
-        color: #4CAF50;
-        font-weight: bold;
-    }
-    .confidence-medium {
-        color: #FF9800;
-        font-weight: bold;
-    }
-    .confidence-low {
-        color: #F44336;
-        font-weight: bold;
-    }
-</style>
-""", unsafe_allow_html=True)
+@st.cache_resource
+def load_css() -> str:
+    """Read the page stylesheet once per server process"""
+    css = (Path(__file__).parent / "assets" / "styles.css").read_text()
+    return f"<style>{css}</style>"
+
+
+st.markdown(load_css(), unsafe_allow_html=True)
 
 # Initialize session state
 if 'prospects' not in st.session_state:
     st.session_state.prospects = None
+if 'prospects_df' not in st.session_state:
+    st.session_state.prospects_df = None
+if 'industry_options' not in st.session_state:
+    st.session_state.industry_options = []
 if 'search_complete' not in st.session_state:
     st.session_state.search_complete = False
 
@@ -77,7 +226,14 @@ st.markdown('<h1 class="main-header">🎯 ProspectSearchAgent</h1>', unsafe_allo
 st.markdown('<p class="sub-header">AI-Powered B2B Prospect Finder</p>', unsafe_allow_html=True)
 
 # Sidebar - Configuration
-with st.sidebar:
+@st.fragment
+def sidebar_controls():
+    """
+    ICP and search settings
+    
+    Runs as a fragment so widget changes only rerun the sidebar; pressing
+    Search stores the request in session state and reruns the whole app.
+    """
     st.header("⚙️ Configuration")
     
     # API Keys
@@ -166,90 +322,77 @@ with st.sidebar:
     st.divider()
     
     # Search Button
-    search_button = st.button("🚀 Search Prospects", type="primary", use_container_width=True)
+    if st.button("🚀 Search Prospects", type="primary", use_container_width=True):
+        # Build ICP config
+        icp_config = {
+            "icp": {
+                "revenue_min": revenue_min * 1000000,
+                "revenue_max": revenue_max * 1000000,
+                "industry": industries,
+                "geography": geography,
+                "employee_count_min": employee_min,
+                "employee_count_max": employee_max,
+                "keywords": keywords
+            },
+            "signals": {
+                "funding": True,
+                "hiring_data_roles": True,
+                "tech_stack": ["AWS", "Snowflake", "Python"],
+                "job_titles_to_search": [
+                    "VP Data", "Chief Data Officer", "VP Engineering",
+                    "CTO", "Head of Analytics"
+                ]
+            },
+            "search_params": {
+                "max_results": max_results,
+                "min_confidence_score": min_confidence,
+                "include_contacts": True,
+                "max_contacts_per_company": max_contacts
+            }
+        }
+        
+        st.session_state.search_request = (icp_config, apollo_key, crunchbase_key, serp_key)
+        st.rerun()
+
+
+with st.sidebar:
+    sidebar_controls()
 
 # Main content area
-if search_button:
-    # Build ICP config
-    icp_config = {
-        "icp": {
-            "revenue_min": revenue_min * 1000000,
-            "revenue_max": revenue_max * 1000000,
-            "industry": industries,
-            "geography": geography,
-            "employee_count_min": employee_min,
-            "employee_count_max": employee_max,
-            "keywords": keywords
-        },
-        "signals": {
-            "funding": True,
-            "hiring_data_roles": True,
-            "tech_stack": ["AWS", "Snowflake", "Python"],
-            "job_titles_to_search": [
-                "VP Data", "Chief Data Officer", "VP Engineering",
-                "CTO", "Head of Analytics"
-            ]
-        },
-        "search_params": {
-            "max_results": max_results,
-            "min_confidence_score": min_confidence,
-            "include_contacts": True,
-            "max_contacts_per_company": max_contacts
-        }
-    }
+search_request = st.session_state.pop('search_request', None)
+if search_request:
+    icp_config, apollo_key, crunchbase_key, serp_key = search_request
     
     # Show progress
     with st.spinner("🔍 Searching for prospects... This may take a moment."):
         try:
-            # Initialize agent
-            agent = ProspectSearchAgent(
-                apollo_api_key=apollo_key if apollo_key else None,
-                crunchbase_api_key=crunchbase_key if crunchbase_key else None,
-                serp_api_key=serp_key if serp_key else None
+            # Run search (identical ICPs are served from the cache)
+            live_results = st.empty()
+            prospects = run_search(
+                icp_config,
+                apollo_key,
+                crunchbase_key,
+                serp_key,
+                placeholder=live_results
             )
-            
-            # Run search
-            prospects = agent.search_prospects(icp_config)
+            live_results.empty()
             
             # Store in session state
             st.session_state.prospects = prospects
+            st.session_state.prospects_df = build_prospects_frame(prospects)
+            st.session_state.industry_options = sorted(st.session_state.prospects_df['industry'].unique())
             st.session_state.search_complete = True
             
-            # Close agent
-            agent.close()
-            
             st.success(f"✅ Found {len(prospects)} matching prospects!")
             
         except Exception as e:
             st.error(f"❌ Error during search: {str(e)}")
             st.exception(e)
 
-# Display Results
-if st.session_state.search_complete and st.session_state.prospects:
-    prospects = st.session_state.prospects
-    
-    # Summary metrics
-    st.header("📊 Search Summary")
-    
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        st.metric("Total Prospects", len(prospects))
-    
-    with col2:
-        avg_confidence = sum(p['confidence'] for p in prospects) / len(prospects) if prospects else 0
-        st.metric("Avg Confidence", f"{avg_confidence:.2f}")
-    
-    with col3:
-        total_contacts = sum(len(p.get('contacts', [])) for p in prospects)
-        st.metric("Total Contacts", total_contacts)
-    
-    with col4:
-        with_funding = sum(1 for p in prospects if p.get('signals', {}).get('new_funding'))
-        st.metric("Companies w/ Funding", with_funding)
-    
-    st.divider()
-    
+
+@st.fragment
+def show_results(prospects: list, prospects_df: pd.DataFrame):
+    """Filters, prospects table and export; reruns on its own when a filter changes"""
     # Filters
     st.header("🔎 Filter Results")
     col1, col2, col3 = st.columns(3)
@@ -257,7 +400,7 @@ if st.session_state.search_complete and st.session_state.prospects:
     with col1:
         filter_industry = st.multiselect(
             "Filter by Industry",
-            options=list(set(p.get('industry', 'Unknown') for p in prospects)),
+            options=st.session_state.industry_options,
             default=[]
         )
     
@@ -274,17 +417,17 @@ if st.session_state.search_complete and st.session_state.prospects:
     with col3:
         filter_funding = st.checkbox("Only with Funding", value=False)
     
-    # Apply filters
-    filtered_prospects = prospects
+    # Apply filters as one boolean mask over the prospects frame
+    mask = prospects_df['confidence'] >= filter_confidence
     
     if filter_industry:
-        filtered_prospects = [p for p in filtered_prospects if p.get('industry') in filter_industry]
-    
-    if filter_confidence > 0:
-        filtered_prospects = [p for p in filtered_prospects if p.get('confidence', 0) >= filter_confidence]
+        mask &= prospects_df['industry'].isin(filter_industry)
     
     if filter_funding:
-        filtered_prospects = [p for p in filtered_prospects if p.get('signals', {}).get('new_funding')]
+        mask &= prospects_df['has_funding']
+    
+    filtered_df = prospects_df[mask]
+    filtered_prospects = [prospects[i] for i in filtered_df.index]
     
     st.info(f"Showing {len(filtered_prospects)} of {len(prospects)} prospects")
     
@@ -293,96 +436,69 @@ if st.session_state.search_complete and st.session_state.prospects:
     # Display prospects
     st.header("🎯 Prospects")
     
-    for idx, prospect in enumerate(filtered_prospects, 1):
-        with st.container():
-            # Confidence badge
-            confidence = prospect.get('confidence', 0)
-            if confidence >= 0.8:
-                conf_class = "confidence-high"
-                conf_icon = "🟢"
-            elif confidence >= 0.6:
-                conf_class = "confidence-medium"
-                conf_icon = "🟡"
-            else:
-                conf_class = "confidence-low"
-                conf_icon = "🔴"
-            
-            # Company header
-            col1, col2 = st.columns([3, 1])
-            
-            with col1:
-                st.subheader(f"{idx}. {prospect.get('company_name', 'Unknown')}")
-                st.caption(f"🌐 {prospect.get('domain', 'N/A')} | 🏢 {prospect.get('industry', 'N/A')}")
-            
-            with col2:
-                st.markdown(f"{conf_icon} <span class='{conf_class}'>{confidence:.0%} Match</span>", unsafe_allow_html=True)
-            
-            # Company details
-            col1, col2, col3, col4 = st.columns(4)
-            
-            with col1:
-                revenue = prospect.get('revenue')
-                if revenue:
-                    st.metric("Revenue", f"${revenue/1000000:.1f}M")
-                else:
-                    st.metric("Revenue", "N/A")
-            
-            with col2:
-                employees = prospect.get('employee_count')
-                if employees:
-                    st.metric("Employees", f"{employees:,}")
-                else:
-                    st.metric("Employees", "N/A")
-            
-            with col3:
-                funding_stage = prospect.get('funding_stage', 'N/A')
-                st.metric("Funding Stage", funding_stage)
-            
-            with col4:
-                location = prospect.get('location', 'N/A')
-                st.metric("Location", location)
-            
-            # Description
-            if prospect.get('description'):
-                st.write(f"**Description:** {prospect.get('description')}")
-            
-            # Signals
-            signals = prospect.get('signals', {})
-            signal_badges = []
-            
-            if signals.get('new_funding'):
-                signal_badges.append("🚀 New Funding")
-            if signals.get('recent_hiring'):
-                signal_badges.append("👥 Hiring")
-            if signals.get('data_roles_count', 0) > 0:
-                signal_badges.append(f"📊 {signals.get('data_roles_count')} Data Roles")
-            
-            if signal_badges:
-                st.write("**Signals:** " + " | ".join(signal_badges))
-            
-            # Contacts
-            contacts = prospect.get('contacts', [])
-            if contacts:
-                with st.expander(f"📇 View {len(contacts)} Contact(s)"):
-                    for contact in contacts:
-                        col1, col2 = st.columns([2, 1])
-                        
-                        with col1:
-                            st.write(f"**{contact.get('name', 'N/A')}**")
-                            st.caption(f"{contact.get('title', 'N/A')}")
-                        
-                        with col2:
-                            if contact.get('email'):
-                                st.code(contact.get('email'))
-                            if contact.get('linkedin_url'):
-                                st.markdown(f"[LinkedIn]({contact.get('linkedin_url')})")
-            
-            # Sources
-            sources = prospect.get('source', [])
-            if sources:
-                st.caption(f"**Data Sources:** {', '.join(sources)}")
-            
-            st.divider()
+    # Pagination - only the current page is sent to the browser
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        page_size = st.selectbox("Rows per page", [10, 25, 50], index=0)
+    
+    with col2:
+        page_count = max(1, math.ceil(len(filtered_prospects) / page_size))
+        page = st.number_input("Page", min_value=1, max_value=page_count, value=1, step=1)
+    
+    page_df = filtered_df.iloc[(page - 1) * page_size : page * page_size]
+    
+    # One table for all prospects instead of a block of widgets per row
+    table_columns = [c if c != 'domain' else 'domain_url' for c in PROSPECT_TABLE_COLUMNS]
+    
+    table_event = st.dataframe(
+        page_df[table_columns],
+        column_config={
+            "company_name": st.column_config.TextColumn("Company"),
+            "domain_url": st.column_config.LinkColumn("Domain", display_text=r"https://(.*)"),
+            "industry": st.column_config.TextColumn("Industry"),
+            "revenue": st.column_config.NumberColumn("Revenue", format="$%d"),
+            "employee_count": st.column_config.NumberColumn("Employees", format="%d"),
+            "confidence": st.column_config.ProgressColumn(
+                "Confidence", min_value=0.0, max_value=1.0, format="%.2f"
+            ),
+            "funding_stage": st.column_config.TextColumn("Funding Stage"),
+            "location": st.column_config.TextColumn("Location"),
+        },
+        use_container_width=True,
+        hide_index=True,
+        on_select="rerun",
+        selection_mode="single-row",
+        key="prospects_table"
+    )
+    
+    # Details for the selected prospect
+    selected_rows = [row for row in table_event.selection.rows if row < len(page_df)]
+    if not selected_rows:
+        st.caption("Select a row to view contacts and signals.")
+    else:
+        prospect = prospects[page_df.index[selected_rows[0]]]
+        
+        # Company card as a single HTML block
+        st.markdown(page_df['card_html'].iloc[selected_rows[0]], unsafe_allow_html=True)
+        
+        # Contacts
+        contacts = prospect.get('contacts', [])
+        if contacts:
+            st.write(f"**📇 {len(contacts)} Contact(s)**")
+            st.dataframe(
+                pd.DataFrame(contacts, columns=['name', 'title', 'email', 'linkedin_url']),
+                column_config={
+                    "name": st.column_config.TextColumn("Name"),
+                    "title": st.column_config.TextColumn("Title"),
+                    "email": st.column_config.TextColumn("Email"),
+                    "linkedin_url": st.column_config.LinkColumn("LinkedIn"),
+                },
+                use_container_width=True,
+                hide_index=True
+            )
+    
+    st.divider()
     
     # Export options
     st.header("💾 Export Results")
@@ -391,10 +507,9 @@ if st.session_state.search_complete and st.session_state.prospects:
     
     with col1:
         # Export to JSON
-        json_data = json.dumps(filtered_prospects, indent=2, default=str)
         st.download_button(
             label="📥 Download JSON",
-            data=json_data,
+            data=prospects_to_json_bytes(filtered_prospects),
             file_name="prospects.json",
             mime="application/json",
             use_container_width=True
@@ -402,20 +517,10 @@ if st.session_state.search_complete and st.session_state.prospects:
     
     with col2:
         # Export to CSV (simple format)
-        import csv
-        import io
-        
-        csv_buffer = io.StringIO()
         if filtered_prospects:
-            fieldnames = ['company_name', 'domain', 'industry', 'revenue', 'employee_count', 
-                         'confidence', 'location', 'funding_stage']
-            writer = csv.DictWriter(csv_buffer, fieldnames=fieldnames, extrasaction='ignore')
-            writer.writeheader()
-            writer.writerows(filtered_prospects)
-            
             st.download_button(
                 label="📥 Download CSV",
-                data=csv_buffer.getvalue(),
+                data=prospects_to_csv_bytes(filtered_prospects),
                 file_name="prospects.csv",
                 mime="text/csv",
                 use_container_width=True
@@ -425,9 +530,38 @@ if st.session_state.search_complete and st.session_state.prospects:
         # Clear results
         if st.button("🗑️ Clear Results", use_container_width=True):
             st.session_state.prospects = None
+            st.session_state.prospects_df = None
+            st.session_state.industry_options = []
             st.session_state.search_complete = False
             st.rerun()
 
+
+# Display Results
+if st.session_state.search_complete and st.session_state.prospects:
+    prospects = st.session_state.prospects
+    prospects_df = st.session_state.prospects_df
+    
+    # Summary metrics
+    st.header("📊 Search Summary")
+    
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.metric("Total Prospects", len(prospects))
+    
+    with col2:
+        st.metric("Avg Confidence", f"{prospects_df['confidence'].mean():.2f}")
+    
+    with col3:
+        st.metric("Total Contacts", int(prospects_df['contacts'].str.len().sum()))
+    
+    with col4:
+        st.metric("Companies w/ Funding", int(prospects_df['has_funding'].sum()))
+    
+    st.divider()
+    
+    show_results(prospects, prospects_df)
+
 else:
     # Welcome screen
     st.info("👈 Configure your search parameters in the sidebar and click 'Search Prospects' to begin!")
@@ -4,7 +4,10 @@ Demo script to run the ProspectSearchAgent
 import os
 import sys
 import json
+import argparse
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import List, Dict, Any, Optional
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent))
@@ -106,5 +109,83 @@ def main():
         print("\nAgent closed. Goodbye!")
 
 
+def _output_paths(icp_paths: List[str]) -> List[str]:
+    """
+    Pick a results file for each ICP path, named after its stem
+    
+    ICPs whose stems collide (a.yaml and a.json, x/icp.yaml and y/icp.yaml)
+    get a numbered suffix so parallel searches never write the same file.
+    """
+    used = set()
+    output_paths = []
+    for icp_path in icp_paths:
+        stem = Path(icp_path).stem
+        name, n = stem, 1
+        while name in used:
+            n += 1
+            name = f"{stem}_{n}"
+        used.add(name)
+        output_paths.append(f"output/{name}_prospects.json")
+    return output_paths
+
+
+def _search_icp(agent: ProspectSearchAgent, icp_path: str, output_path: str) -> Optional[List[Dict[str, Any]]]:
+    """Run a search for one ICP file and save results to output_path"""
+    try:
+        agent.load_icp(icp_path)
+        prospects = agent.search_prospects()
+        agent.save_results(prospects, output_path)
+        return prospects
+    except Exception as e:
+        print(f"ERROR: {icp_path}: {str(e)}")
+        return None
+
+
+def run_batch(icp_paths: List[str], max_workers: int = 4) -> List[Optional[List[Dict[str, Any]]]]:
+    """
+    Run searches for several ICP configs in parallel
+    
+    Args:
+        icp_paths: Paths to ICP config files (YAML or JSON)
+        max_workers: Number of searches to run at once
+    
+    Returns:
+        List of prospect lists, in the same order as icp_paths (None where
+        a search failed)
+    """
+    print(f"Running batch search for {len(icp_paths)} ICP configs ({max_workers} workers)...")
+    output_paths = _output_paths(icp_paths)
+    
+    # Each ICP gets its own fork since the agent holds per-search ICP state;
+    # the forks share one set of API clients and rate limiters
+    agent = ProspectSearchAgent()
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(
+                lambda icp_path, output_path: _search_icp(agent.fork(), icp_path, output_path),
+                icp_paths, output_paths
+            ))
+    finally:
+        agent.close()
+    
+    for icp_path, output_path, prospects in zip(icp_paths, output_paths, results):
+        if prospects is None:
+            print(f"✗ {icp_path}: search failed")
+        else:
+            print(f"✓ {icp_path}: {len(prospects)} prospects -> {output_path}")
+    
+    return results
+
+
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Run the ProspectSearchAgent")
+    parser.add_argument("--batch", nargs="+", metavar="ICP_PATH",
+                        help="Search several ICP config files in parallel")
+    parser.add_argument("--workers", type=int, default=4,
+                        help="Parallel searches in batch mode (default: 4)")
+    args = parser.parse_args()
+    
+    if args.batch:
+        run_batch(args.batch, max_workers=args.workers)
+    else:
+        main()
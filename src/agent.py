@@ -2,10 +2,14 @@
 Main ProspectSearchAgent orchestrator
 """
 import os
-import json
+import copy
+import functools
+import heapq
+import operator
+import orjson
 import yaml
 import logging
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Iterator
 from dotenv import load_dotenv
 import asyncio
 from concurrent.futures import ThreadPoolExecutor
@@ -26,6 +30,20 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# libyaml-backed loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@functools.lru_cache(maxsize=32)
+def _read_icp_file(config_path: str, mtime: float) -> Dict[str, Any]:
+    """Parse an ICP config file; mtime is part of the cache key"""
+    if config_path.endswith('.json'):
+        with open(config_path, 'rb') as f:
+            return orjson.loads(f.read())
+    
+    with open(config_path, 'r') as f:
+        return yaml.load(f, Loader=_YAML_LOADER)
+
 
 class ProspectSearchAgent:
     """
@@ -94,13 +112,13 @@ class ProspectSearchAgent:
         """
         logger.info(f"Loading ICP from {config_path}")
         
-        with open(config_path, 'r') as f:
-            if config_path.endswith('.yaml') or config_path.endswith('.yml'):
-                self.icp_config = yaml.safe_load(f)
-            elif config_path.endswith('.json'):
-                self.icp_config = json.load(f)
-            else:
-                raise ValueError("Config file must be YAML or JSON")
+        if not config_path.endswith(('.yaml', '.yml', '.json')):
+            raise ValueError("Config file must be YAML or JSON")
+        
+        # Parsed configs are cached until the file changes
+        self.icp_config = copy.deepcopy(
+            _read_icp_file(config_path, os.path.getmtime(config_path))
+        )
         
         # Initialize scorer with ICP config
         self.scorer = ProspectScorer(self.icp_config)
@@ -118,6 +136,44 @@ class ProspectSearchAgent:
         Returns:
             List of enriched prospect dicts with companies and contacts
         """
+        # Drain the stream first: it is what applies icp_config to the agent
+        prospects = list(self.search_prospects_stream(icp_config))
+        
+        # Keep the top max_results by confidence score
+        max_results = self.icp_config.get("search_params", {}).get("max_results", 50)
+        enriched_prospects = heapq.nlargest(max_results, prospects, key=operator.itemgetter("confidence"))
+        
+        logger.info(f"Search complete: {len(enriched_prospects)} prospects found")
+        return enriched_prospects
+    
+    async def search_prospects_async(self, icp_config: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """
+        Async variant of search_prospects for use from an event loop
+        
+        The search runs in a worker thread, so the loop stays free while the
+        agent's thread pools fan out the HTTP requests.
+        
+        Args:
+            icp_config: ICP configuration dict (optional if already loaded)
+        
+        Returns:
+            List of enriched prospect dicts with companies and contacts
+        """
+        return await asyncio.to_thread(self.search_prospects, icp_config)
+    
+    def search_prospects_stream(self, icp_config: Optional[Dict[str, Any]] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Search for prospects, yielding each one as soon as it is scored
+        
+        Prospects are yielded in processing order and are not limited to
+        max_results; use search_prospects() for the sorted, capped list.
+        
+        Args:
+            icp_config: ICP configuration dict (optional if already loaded)
+        
+        Yields:
+            Enriched prospect dicts that pass the confidence threshold
+        """
         if icp_config:
             self.icp_config = icp_config
             self.scorer = ProspectScorer(icp_config)
@@ -127,18 +183,25 @@ class ProspectSearchAgent:
         
         logger.info("Starting prospect search...")
         
-        # Step 1: Fetch companies from multiple sources
+        # Step 1: Fetch companies from multiple sources (in parallel)
         all_companies = []
         
+        fetchers = {}
         if self.apollo:
-            logger.info("Fetching companies from Apollo...")
-            apollo_companies = self._fetch_apollo_companies()
-            all_companies.extend(apollo_companies)
-        
+            fetchers["Apollo"] = self._fetch_apollo_companies
         if self.crunchbase:
-            logger.info("Fetching companies from Crunchbase...")
-            cb_companies = self._fetch_crunchbase_companies()
-            all_companies.extend(cb_companies)
+            fetchers["Crunchbase"] = self._fetch_crunchbase_companies
+        
+        if fetchers:
+            with ThreadPoolExecutor(max_workers=len(fetchers)) as executor:
+                futures = {}
+                for source, fetch in fetchers.items():
+                    logger.info(f"Fetching companies from {source}...")
+                    futures[source] = executor.submit(fetch)
+                
+                # Collect in source order so merging stays deterministic
+                for future in futures.values():
+                    all_companies.extend(future.result())
         
         logger.info(f"Fetched {len(all_companies)} companies from all sources")
         
@@ -148,57 +211,100 @@ class ProspectSearchAgent:
         
         logger.info(f"After merging and deduplication: {len(unique_companies)} unique companies")
         
-        # Step 3: Enrich with signals (funding, hiring, tech stack)
-        enriched_prospects = []
-        
-        for company in unique_companies:
-            logger.info(f"Processing company: {company.get('company_name')}")
-            
-            # Fetch signals
-            signals = self._fetch_signals(company)
-            
-            # Fetch contacts if requested
-            contacts = []
-            if self.icp_config.get("search_params", {}).get("include_contacts", True):
-                contacts = self._fetch_contacts(company)
-            
-            # Calculate confidence score
-            confidence = self.scorer.calculate_score(company, contacts, signals)
-            
-            # Filter by minimum confidence
-            min_confidence = self.icp_config.get("search_params", {}).get("min_confidence_score", 0.7)
-            if confidence < min_confidence:
-                logger.info(f"Skipping {company.get('company_name')} - confidence {confidence} below threshold {min_confidence}")
-                continue
-            
-            # Build prospect object
-            prospect = {
-                "company_name": company.get("company_name"),
-                "domain": company.get("domain"),
-                "revenue": company.get("revenue"),
-                "employee_count": company.get("employee_count"),
-                "industry": company.get("industry"),
-                "location": company.get("location"),
-                "description": company.get("description"),
-                "funding_stage": company.get("funding_stage"),
-                "funding_total": company.get("funding_total"),
-                "contacts": contacts,
-                "signals": signals,
-                "source": company.get("sources", []),
-                "confidence": confidence
-            }
-            
-            enriched_prospects.append(prospect)
-        
-        # Sort by confidence score
-        enriched_prospects.sort(key=lambda x: x["confidence"], reverse=True)
+        # Read search settings once rather than per company
+        search_params = self.icp_config.get("search_params") or {}
+        concurrency = search_params.get("concurrency", 16)
+        job_titles = (self.icp_config.get("signals") or {}).get("job_titles_to_search", [])
+        include_contacts = search_params.get("include_contacts", True)
+        max_contacts = search_params.get("max_contacts_per_company", 5)
+        
+        # Step 3: Enrich with signals (funding, hiring, tech stack), one
+        # company per worker; contact lookups run on a second pool so they
+        # overlap with the same company's signal lookups
+        with ThreadPoolExecutor(max_workers=concurrency) as company_pool, \
+                ThreadPoolExecutor(max_workers=concurrency) as contacts_pool:
+            process = functools.partial(
+                self._process_company,
+                contacts_pool=contacts_pool,
+                include_contacts=include_contacts,
+                min_confidence=search_params.get("min_confidence_score", 0.7),
+                max_contacts=max_contacts,
+                job_titles=job_titles
+            )
+            kept = 0
+            for prospect in company_pool.map(process, unique_companies):
+                if prospect is not None:
+                    kept += 1
+                    yield prospect
+        
+        logger.info(
+            f"Processed {len(unique_companies)} companies: {kept} kept, "
+            f"{len(unique_companies) - kept} below confidence threshold"
+        )
+    
+    def _process_company(
+        self,
+        company: Dict[str, Any],
+        contacts_pool: ThreadPoolExecutor,
+        include_contacts: bool,
+        min_confidence: float,
+        max_contacts: int,
+        job_titles: List[str]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Enrich and score a single company
         
-        # Limit results
-        max_results = self.icp_config.get("search_params", {}).get("max_results", 50)
-        enriched_prospects = enriched_prospects[:max_results]
+        Args:
+            company: Merged company data dict
+            contacts_pool: Executor used to fetch contacts alongside signals
+            include_contacts: Whether to fetch contacts
+            min_confidence: Minimum confidence score to keep the company
+            max_contacts: Maximum contacts to fetch
+            job_titles: Job titles used for contact and hiring searches
         
-        logger.info(f"Search complete: {len(enriched_prospects)} prospects found")
-        return enriched_prospects
+        Returns:
+            Prospect dict, or None if below the confidence threshold
+        """
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Processing company: %s", company.get("company_name"))
+        
+        # Fetch contacts if requested
+        contacts_future = None
+        if include_contacts:
+            contacts_future = contacts_pool.submit(self._fetch_contacts, company, job_titles, max_contacts)
+        
+        # Fetch signals
+        signals = self._fetch_signals(company, job_titles)
+        contacts = contacts_future.result() if contacts_future else []
+        
+        # Calculate confidence score
+        confidence = self.scorer.calculate_score(company, contacts, signals)
+        
+        # Filter by minimum confidence
+        if confidence < min_confidence:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Skipping %s - confidence %s below threshold %s",
+                    company.get("company_name"), confidence, min_confidence
+                )
+            return None
+        
+        # Build prospect object
+        return {
+            "company_name": company.get("company_name"),
+            "domain": company.get("domain"),
+            "revenue": company.get("revenue"),
+            "employee_count": company.get("employee_count"),
+            "industry": company.get("industry"),
+            "location": company.get("location"),
+            "description": company.get("description"),
+            "funding_stage": company.get("funding_stage"),
+            "funding_total": company.get("funding_total"),
+            "contacts": contacts,
+            "signals": signals,
+            "source": company.get("sources", []),
+            "confidence": confidence
+        }
     
     def _fetch_apollo_companies(self) -> List[Dict[str, Any]]:
         """Fetch companies from Apollo or use mock data for demo"""
@@ -225,10 +331,8 @@ class ProspectSearchAgent:
                 logger.warning("Apollo returned no results (free tier limitation). Using mock data for demo.")
                 return self._fetch_mock_companies()
             
-            return [
-                self.normalizer.normalize_apollo_organization(org)
-                for org in organizations
-            ]
+            normalize = self.normalizer.normalize_apollo_organization
+            return [normalize(org) for org in organizations]
         except Exception as e:
             logger.error(f"Failed to fetch from Apollo: {str(e)}")
             logger.info("Using mock data as fallback")
@@ -248,20 +352,18 @@ class ProspectSearchAgent:
                 limit=25
             )
             
-            return [
-                self.normalizer.normalize_crunchbase_organization(org)
-                for org in organizations
-            ]
+            return list(map(self.normalizer.normalize_crunchbase_organization, organizations))
         except Exception as e:
             logger.error(f"Failed to fetch from Crunchbase: {str(e)}")
             return []
     
-    def _fetch_signals(self, company: Dict[str, Any]) -> Dict[str, Any]:
+    def _fetch_signals(self, company: Dict[str, Any], job_titles: List[str]) -> Dict[str, Any]:
         """
         Fetch signals (funding, hiring, tech stack) for a company
         
         Args:
             company: Company data dict
+            job_titles: Job titles to look for in postings
         
         Returns:
             Signals dict
@@ -283,7 +385,6 @@ class ProspectSearchAgent:
         # Fetch hiring signals from SerpAPI
         if self.serpapi and company_name:
             try:
-                job_titles = self.icp_config.get("signals", {}).get("job_titles_to_search", [])
                 job_data = self.serpapi.search_jobs(
                     company_name=company_name,
                     job_titles=job_titles
@@ -296,12 +397,19 @@ class ProspectSearchAgent:
         
         return signals
     
-    def _fetch_contacts(self, company: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def _fetch_contacts(
+        self,
+        company: Dict[str, Any],
+        job_titles: List[str],
+        max_contacts: int
+    ) -> List[Dict[str, Any]]:
         """
         Fetch contacts for a company
         
         Args:
             company: Company data dict
+            job_titles: Job titles to search for
+            max_contacts: Maximum contacts to return
         
         Returns:
             List of contact dicts
@@ -309,7 +417,6 @@ class ProspectSearchAgent:
         if not self.apollo:
             # Use mock contacts for demo
             domain = company.get("domain", "example.com")
-            max_contacts = self.icp_config.get("search_params", {}).get("max_contacts_per_company", 3)
             mock_contacts = MockDataGenerator.generate_contacts(domain, count=max_contacts)
             
             return [
@@ -321,11 +428,9 @@ class ProspectSearchAgent:
         
         try:
             # Search for people at this company
-            job_titles = self.icp_config.get("signals", {}).get("job_titles_to_search", [])
-            
             response = self.apollo.search_people(
                 titles=job_titles,
-                per_page=self.icp_config.get("search_params", {}).get("max_contacts_per_company", 5)
+                per_page=max_contacts
             )
             
             people = response.get("people", [])
@@ -334,23 +439,25 @@ class ProspectSearchAgent:
             if not people:
                 logger.info(f"No contacts found via Apollo for {company.get('company_name')}, using mock data")
                 domain = company.get("domain", "example.com")
-                max_contacts = self.icp_config.get("search_params", {}).get("max_contacts_per_company", 3)
                 mock_contacts = MockDataGenerator.generate_contacts(domain, count=max_contacts)
                 people = mock_contacts
             
+            # Keep unique contacts with an email, stopping once we have enough
+            seen_emails = set()
             for person in people:
                 contact = self.normalizer.normalize_apollo_person(person)
-                if contact.get("email"):  # Only include contacts with email
-                    contacts.append(contact)
-            
-            # Deduplicate contacts
-            contacts = Deduplicator.deduplicate_contacts(contacts)
+                email = (contact.get("email") or "").lower().strip()
+                if not email or email in seen_emails:
+                    continue
+                seen_emails.add(email)
+                contacts.append(contact)
+                if len(contacts) >= max_contacts:
+                    break
             
         except Exception as e:
             logger.error(f"Failed to fetch contacts for {company.get('company_name')}: {str(e)}")
             # Fallback to mock data
             domain = company.get("domain", "example.com")
-            max_contacts = self.icp_config.get("search_params", {}).get("max_contacts_per_company", 3)
             mock_contacts = MockDataGenerator.generate_contacts(domain, count=max_contacts)
             contacts = [
                 self.normalizer.normalize_apollo_person(contact)
@@ -363,6 +470,9 @@ class ProspectSearchAgent:
         """
         Save prospect results to JSON file
         
+        A .jsonl or .ndjson path is written one prospect per line, which keeps
+        memory flat for very large result sets.
+        
         Args:
             prospects: List of prospect dicts
             output_path: Path to output file
@@ -371,8 +481,21 @@ class ProspectSearchAgent:
         
         os.makedirs(os.path.dirname(output_path), exist_ok=True)
         
-        with open(output_path, 'w') as f:
-            json.dump(prospects, f, indent=2, default=str)
+        # default=str only runs for types orjson can't serialize natively
+        with open(output_path, 'wb') as f:
+            if output_path.endswith((".jsonl", ".ndjson")):
+                for prospect in prospects:
+                    f.write(orjson.dumps(
+                        prospect,
+                        default=str,
+                        option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE
+                    ))
+            else:
+                f.write(orjson.dumps(
+                    prospects,
+                    default=str,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                ))
         
         logger.info(f"Results saved to {output_path}")
     
@@ -395,6 +518,22 @@ class ProspectSearchAgent:
         
         return normalized
     
+    def fork(self) -> "ProspectSearchAgent":
+        """
+        Create an agent for another ICP that shares this agent's API clients
+        
+        The fork reuses the clients' sessions, response caches and rate
+        limiters, so parallel searches stay within one set of API limits.
+        Only close the original agent.
+        
+        Returns:
+            ProspectSearchAgent with no ICP loaded
+        """
+        forked = copy.copy(self)
+        forked.icp_config = None
+        forked.scorer = None
+        return forked
+    
     def close(self):
         """Close all API clients"""
         if self.apollo:
@@ -2,61 +2,111 @@
 Base API client with rate limiting and error handling
 """
 import time
+import hashlib
 import logging
+import threading
+import orjson
+from concurrent.futures import Future
 from typing import Optional, Dict, Any
 import requests
-from functools import wraps
+from requests.adapters import HTTPAdapter
+from requests_cache import CachedSession
+from urllib3.util.retry import Retry
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# SQLite file backing the HTTP response cache; one file per API key
+CACHE_PATH = ".cache/api"
+
+# Retry rate limits, server errors and dropped connections with exponential
+# backoff and jitter; other client errors (400, 401, ...) fail immediately
+RETRY_POLICY = Retry(
+    total=3,
+    backoff_factor=0.5,
+    backoff_jitter=0.3,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset(["GET", "POST"]),
+    respect_retry_after_header=True,
+    raise_on_status=False,
+)
+
 
 class RateLimiter:
-    """Simple rate limiter for API calls"""
+    """
+    Token-bucket rate limiter for API calls
     
-    def __init__(self, calls_per_minute: int = 60):
+    Up to `burst` calls go out immediately; after that, calls are paced at
+    calls_per_minute as the bucket refills.
+    """
+    
+    def __init__(self, calls_per_minute: int = 60, burst: Optional[int] = None):
         self.calls_per_minute = calls_per_minute
-        self.min_interval = 60.0 / calls_per_minute
-        self.last_call = 0
+        self.capacity = float(burst or calls_per_minute)
+        self.rate = calls_per_minute / 60.0  # tokens per second
+        self.tokens = self.capacity
+        self.last_refill = time.monotonic()
+        self.lock = threading.Lock()
     
     def wait(self):
         """Wait if necessary to respect rate limit"""
-        elapsed = time.time() - self.last_call
-        if elapsed < self.min_interval:
-            time.sleep(self.min_interval - elapsed)
-        self.last_call = time.time()
-
-
-def retry_on_failure(max_retries: int = 3, delay: float = 1.0):
-    """Decorator to retry failed API calls"""
-    def decorator(func):
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            for attempt in range(max_retries):
-                try:
-                    return func(*args, **kwargs)
-                except Exception as e:
-                    if attempt == max_retries - 1:
-                        logger.error(f"Failed after {max_retries} attempts: {str(e)}")
-                        raise
-                    logger.warning(f"Attempt {attempt + 1} failed: {str(e)}. Retrying...")
-                    time.sleep(delay * (attempt + 1))
-            return None
-        return wrapper
-    return decorator
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(
+                self.capacity,
+                self.tokens + (now - self.last_refill) * self.rate
+            )
+            self.last_refill = now
+            
+            # Reserve a token; a negative balance queues callers behind it
+            self.tokens -= 1
+            delay = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        
+        # Sleep outside the lock so concurrent callers can reserve their slots
+        if delay > 0:
+            time.sleep(delay)
 
 
 class BaseAPIClient:
     """Base class for all API clients"""
     
-    def __init__(self, api_key: str, base_url: str, calls_per_minute: int = 60):
+    # Default lifetime of cached responses, in seconds
+    CACHE_EXPIRE_AFTER = 86400
+    # Per-URL overrides, e.g. shorter lifetimes for search endpoints
+    CACHE_URLS_EXPIRE_AFTER: Dict[str, int] = {}
+    # Calls allowed in a burst before pacing starts (default: one minute's worth)
+    RATE_LIMIT_BURST: Optional[int] = None
+    
+    def __init__(self, api_key: str, base_url: str, calls_per_minute: int = 60,
+                 bypass_cache: bool = False):
         self.api_key = api_key
         self.base_url = base_url
-        self.rate_limiter = RateLimiter(calls_per_minute)
-        self.session = requests.Session()
+        self.rate_limiter = RateLimiter(calls_per_minute, burst=self.RATE_LIMIT_BURST)
+        self.bypass_cache = bypass_cache
+        if bypass_cache:
+            self.session = requests.Session()
+        else:
+            # Responses are cached on disk so repeat runs don't spend API credits.
+            # requests-cache leaves API keys out of the cache key, so each key
+            # gets its own file rather than sharing another account's responses
+            key_hash = hashlib.sha256((api_key or "").encode()).hexdigest()[:16]
+            self.session = CachedSession(
+                f"{CACHE_PATH}-{key_hash}",
+                backend="sqlite",
+                expire_after=self.CACHE_EXPIRE_AFTER,
+                urls_expire_after=self.CACHE_URLS_EXPIRE_AFTER,
+                allowable_methods=("GET", "POST"),
+            )
+        # Size the connection pool for concurrent per-company requests; the
+        # company and contact pools can both hit the same host at once
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=RETRY_POLICY)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         self.timeout = 30
+        # Requests currently being sent, keyed by their parameters
+        self._inflight: Dict[tuple, Future] = {}
+        self._inflight_lock = threading.Lock()
     
-    @retry_on_failure(max_retries=3, delay=1.0)
     def _make_request(
         self, 
         method: str, 
@@ -65,28 +115,99 @@ class BaseAPIClient:
         json_data: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None
     ) -> Dict[str, Any]:
-        """Make an API request with rate limiting and error handling"""
-        self.rate_limiter.wait()
+        """
+        Make an API request, sharing one response between identical concurrent calls
+        
+        If the same request is already in flight on another thread, wait for
+        its result instead of issuing a duplicate call.
+        """
+        key = (
+            method,
+            endpoint,
+            orjson.dumps(params, default=str, option=orjson.OPT_SORT_KEYS),
+            orjson.dumps(json_data, default=str, option=orjson.OPT_SORT_KEYS),
+            orjson.dumps(headers, option=orjson.OPT_SORT_KEYS),
+        )
+        
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            is_owner = future is None
+            if is_owner:
+                future = Future()
+                self._inflight[key] = future
         
+        if not is_owner:
+            return future.result()
+        
+        try:
+            result = self._send_request(method, endpoint, params, json_data, headers)
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+    
+    def _send_request(
+        self, 
+        method: str, 
+        endpoint: str, 
+        params: Optional[Dict[str, Any]] = None,
+        json_data: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None
+    ) -> Dict[str, Any]:
+        """Make an API request with rate limiting and error handling"""
         url = f"{self.base_url}/{endpoint.lstrip('/')}"
         
         default_headers = self._get_headers()
         if headers:
             default_headers.update(headers)
         
+        # Encode the JSON body once with orjson; the Content-Type header is
+        # already application/json
+        body = orjson.dumps(json_data) if json_data is not None else None
+        
+        # Cached responses don't count against the API rate limit
+        if not self._is_cached(method, url, params, body, default_headers):
+            self.rate_limiter.wait()
+        
         logger.info(f"Making {method} request to {url}")
         
         response = self.session.request(
             method=method,
             url=url,
             params=params,
-            json=json_data,
+            data=body,
             headers=default_headers,
             timeout=self.timeout
         )
         
+        if not self.bypass_cache:
+            logger.info(f"Cache {'HIT' if getattr(response, 'from_cache', False) else 'MISS'}: {method} {url}")
+        
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
+    
+    def _is_cached(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        body: Optional[bytes],
+        headers: Dict[str, str]
+    ) -> bool:
+        """Check whether a request would be served from the response cache"""
+        if self.bypass_cache:
+            return False
+        
+        request = self.session.prepare_request(
+            requests.Request(method, url, params=params, data=body, headers=headers)
+        )
+        # contains() ignores expiry, and a stale entry still goes to the network
+        cached = self.session.cache.get_response(self.session.cache.create_key(request))
+        return cached is not None and not cached.is_expired
     
     def _get_headers(self) -> Dict[str, str]:
         """Get default headers for requests. Override in subclasses."""
@@ -4,6 +4,7 @@ Free tier: 100 credits (searches)
 API Docs: https://apolloio.github.io/apollo-api-docs/
 """
 import logging
+import functools
 from typing import List, Dict, Any, Optional
 from .api_client_base import BaseAPIClient
 
@@ -13,18 +14,31 @@ logger = logging.getLogger(__name__)
 class ApolloClient(BaseAPIClient):
     """Client for Apollo.io API"""
     
-    def __init__(self, api_key: str):
+    # People search results change more often than enrichment data
+    CACHE_URLS_EXPIRE_AFTER = {
+        "*/mixed_people/search": 300,
+        "*/organizations/enrich": 86400,
+    }
+    
+    def __init__(self, api_key: str, calls_per_minute: int = 30, bypass_cache: bool = False):
         super().__init__(
             api_key=api_key,
             base_url="https://api.apollo.io/v1",
-            calls_per_minute=30  # Conservative rate limit
+            calls_per_minute=calls_per_minute,
+            bypass_cache=bypass_cache
         )
+        
+        # Enrichment results are fixed for a given key, so memoize them per client.
+        # Failed lookups raise inside the cached call and are not stored.
+        self._enrich_organization_cached = functools.lru_cache(maxsize=2048)(self._request_organization)
+        self._enrich_person_cached = functools.lru_cache(maxsize=2048)(self._request_person)
     
     def _get_headers(self) -> Dict[str, str]:
         """Get headers with API key"""
         headers = super()._get_headers()
         headers["X-Api-Key"] = self.api_key
-        headers["Cache-Control"] = "no-cache"
+        if self.bypass_cache:
+            headers["Cache-Control"] = "no-cache"
         return headers
     
     def search_organizations(
@@ -107,12 +121,7 @@ class ApolloClient(BaseAPIClient):
             Enriched organization data or None
         """
         try:
-            response = self._make_request(
-                method="GET",
-                endpoint="/organizations/enrich",
-                params={"domain": domain}
-            )
-            return response.get("organization")
+            return self._enrich_organization_cached(domain)
         except Exception as e:
             logger.error(f"Apollo organization enrichment failed for {domain}: {str(e)}")
             return None
@@ -127,6 +136,28 @@ class ApolloClient(BaseAPIClient):
         Returns:
             Enriched person data or None
         """
+        if not (email or first_name or last_name or organization_name):
+            logger.warning("No search parameters provided for person enrichment")
+            return None
+        
+        try:
+            return self._enrich_person_cached(email, first_name, last_name, organization_name)
+        except Exception as e:
+            logger.error(f"Apollo person enrichment failed: {str(e)}")
+            return None
+    
+    def _request_organization(self, domain: str) -> Optional[Dict[str, Any]]:
+        """Fetch organization enrichment from the API (uncached)"""
+        response = self._make_request(
+            method="GET",
+            endpoint="/organizations/enrich",
+            params={"domain": domain}
+        )
+        return response.get("organization")
+    
+    def _request_person(self, email: Optional[str], first_name: Optional[str],
+                        last_name: Optional[str], organization_name: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Fetch person enrichment from the API (uncached)"""
         params = {}
         if email:
             params["email"] = email
@@ -137,17 +168,19 @@ class ApolloClient(BaseAPIClient):
         if organization_name:
             params["organization_name"] = organization_name
         
-        if not params:
-            logger.warning("No search parameters provided for person enrichment")
-            return None
-        
-        try:
-            response = self._make_request(
-                method="GET",
-                endpoint="/people/match",
-                params=params
-            )
-            return response.get("person")
-        except Exception as e:
-            logger.error(f"Apollo person enrichment failed: {str(e)}")
-            return None
+        response = self._make_request(
+            method="GET",
+            endpoint="/people/match",
+            params=params
+        )
+        return response.get("person")
+    
+    def close(self):
+        """Log enrichment cache usage and close the session"""
+        org_info = self._enrich_organization_cached.cache_info()
+        person_info = self._enrich_person_cached.cache_info()
+        logger.info(
+            f"Apollo enrichment cache - organizations: {org_info.hits} hits / {org_info.misses} misses, "
+            f"people: {person_info.hits} hits / {person_info.misses} misses"
+        )
+        super().close()
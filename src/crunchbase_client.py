@@ -4,21 +4,81 @@ Free tier: Basic company data
 API Docs: https://data.crunchbase.com/docs
 """
 import logging
+import threading
+import time
+from collections import OrderedDict
 from typing import List, Dict, Any, Optional
 from .api_client_base import BaseAPIClient
 
 logger = logging.getLogger(__name__)
 
+# Fields requested from each endpoint, built once at import
+ORGANIZATION_SEARCH_FIELDS = (
+    "identifier",
+    "name",
+    "short_description",
+    "website",
+    "revenue_range",
+    "num_employees_enum",
+    "categories",
+    "location_identifiers",
+    "funding_total",
+)
+
+ORGANIZATION_DETAIL_FIELDS = ",".join((
+    "identifier",
+    "name",
+    "description",
+    "website",
+    "revenue_range",
+    "num_employees_enum",
+    "categories",
+    "location_identifiers",
+    "funding_total",
+    "last_funding_at",
+    "last_funding_type",
+    "founded_on",
+    "company_type",
+    "ipo_status",
+))
+
+FUNDING_ROUND_FIELDS = (
+    "identifier",
+    "announced_on",
+    "investment_type",
+    "money_raised",
+    "organization_identifier",
+    "investor_identifiers",
+)
+
+# Result ordering for each search
+ORGANIZATION_SEARCH_ORDER = ({"field_id": "rank_org", "sort": "asc"},)
+FUNDING_ROUND_ORDER = ({"field_id": "announced_on", "sort": "desc"},)
+
 
 class CrunchbaseClient(BaseAPIClient):
     """Client for Crunchbase API"""
     
-    def __init__(self, api_key: str):
+    # Searches are re-ranked frequently; entity lookups are stable
+    CACHE_URLS_EXPIRE_AFTER = {
+        "*/searches/*": 3600,
+    }
+    
+    # In-memory organization lookup cache: lifetime in seconds and max entries
+    ORG_CACHE_TTL = 3600
+    ORG_CACHE_MAX_SIZE = 10000
+    
+    def __init__(self, api_key: str, calls_per_minute: int = 20, bypass_cache: bool = False):
         super().__init__(
             api_key=api_key,
             base_url="https://api.crunchbase.com/api/v4",
-            calls_per_minute=20  # Conservative rate limit
+            calls_per_minute=calls_per_minute,
+            bypass_cache=bypass_cache
         )
+        
+        # In-memory organization lookups: permalink -> (fetched_at, properties)
+        self._org_cache: "OrderedDict[str, tuple]" = OrderedDict()
+        self._org_cache_lock = threading.Lock()
     
     def _get_headers(self) -> Dict[str, str]:
         """Get headers with API key"""
@@ -50,19 +110,6 @@ class CrunchbaseClient(BaseAPIClient):
         Returns:
             List of organization entities
         """
-        # Build field IDs for the query
-        field_ids = [
-            "identifier",
-            "name",
-            "short_description",
-            "website",
-            "revenue_range",
-            "num_employees_enum",
-            "categories",
-            "location_identifiers",
-            "funding_total"
-        ]
-        
         # Build query filters
         query = []
         
@@ -99,14 +146,9 @@ class CrunchbaseClient(BaseAPIClient):
             })
         
         body = {
-            "field_ids": field_ids,
+            "field_ids": ORGANIZATION_SEARCH_FIELDS,
             "limit": min(limit, 100),
-            "order": [
-                {
-                    "field_id": "rank_org",
-                    "sort": "asc"
-                }
-            ]
+            "order": ORGANIZATION_SEARCH_ORDER
         }
         
         if query:
@@ -130,31 +172,22 @@ class CrunchbaseClient(BaseAPIClient):
         """
         Get detailed organization data by permalink
         
+        Successful lookups are kept in memory for ORG_CACHE_TTL seconds.
+        
         Args:
             permalink: Crunchbase permalink (e.g., 'apollo-io')
         
         Returns:
             Organization details or None
         """
-        field_ids = [
-            "identifier",
-            "name",
-            "description",
-            "website",
-            "revenue_range",
-            "num_employees_enum",
-            "categories",
-            "location_identifiers",
-            "funding_total",
-            "last_funding_at",
-            "last_funding_type",
-            "founded_on",
-            "company_type",
-            "ipo_status"
-        ]
+        with self._org_cache_lock:
+            cached = self._org_cache.get(permalink)
+            if cached and time.monotonic() - cached[0] < self.ORG_CACHE_TTL:
+                self._org_cache.move_to_end(permalink)
+                return cached[1]
         
         params = {
-            "field_ids": ",".join(field_ids)
+            "field_ids": ORGANIZATION_DETAIL_FIELDS
         }
         
         try:
@@ -163,10 +196,18 @@ class CrunchbaseClient(BaseAPIClient):
                 endpoint=f"/entities/organizations/{permalink}",
                 params=params
             )
-            return response.get("properties", {})
         except Exception as e:
             logger.error(f"Crunchbase get organization failed for {permalink}: {str(e)}")
             return None
+        
+        properties = response.get("properties", {})
+        with self._org_cache_lock:
+            self._org_cache[permalink] = (time.monotonic(), properties)
+            self._org_cache.move_to_end(permalink)
+            if len(self._org_cache) > self.ORG_CACHE_MAX_SIZE:
+                self._org_cache.popitem(last=False)
+        
+        return properties
     
     def search_funding_rounds(
         self,
@@ -185,15 +226,6 @@ class CrunchbaseClient(BaseAPIClient):
         Returns:
             List of funding round entities
         """
-        field_ids = [
-            "identifier",
-            "announced_on",
-            "investment_type",
-            "money_raised",
-            "organization_identifier",
-            "investor_identifiers"
-        ]
-        
         query = []
         
         if organization_name:
@@ -213,14 +245,9 @@ class CrunchbaseClient(BaseAPIClient):
             })
         
         body = {
-            "field_ids": field_ids,
+            "field_ids": FUNDING_ROUND_FIELDS,
             "limit": min(limit, 100),
-            "order": [
-                {
-                    "field_id": "announced_on",
-                    "sort": "desc"
-                }
-            ]
+            "order": FUNDING_ROUND_ORDER
         }
         
         if query:
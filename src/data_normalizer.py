@@ -2,11 +2,51 @@
 Data normalizer to convert different API responses into unified schema
 """
 import logging
+import functools
+import re
+from types import MappingProxyType
 from typing import Dict, Any, List, Optional
 import tldextract
 
 logger = logging.getLogger(__name__)
 
+# A registrable domain with no subdomain, scheme or path, e.g. "apollo.io"
+_BARE_DOMAIN_RE = re.compile(r"^[A-Za-z0-9-]+\.[A-Za-z]{2,}$")
+
+# Domain extractor built once, using the Public Suffix List snapshot bundled
+# with tldextract: no network fetch and no disk cache reads
+_extract_domain = tldextract.TLDExtract(
+    suffix_list_urls=(),
+    cache_dir=None,
+    include_psl_private_domains=False
+)
+
+# Crunchbase revenue range enum -> midpoint revenue
+CRUNCHBASE_REVENUE_MAP = MappingProxyType({
+    "r_00000000": 0,
+    "r_00001000": 500000,
+    "r_00010000": 5000000,
+    "r_00100000": 50000000,
+    "r_01000000": 500000000,
+    "r_10000000": 5000000000,
+})
+
+# Crunchbase employee range enum -> midpoint headcount
+CRUNCHBASE_EMPLOYEE_MAP = MappingProxyType({
+    "c_00001_00010": 5,
+    "c_00011_00050": 30,
+    "c_00051_00100": 75,
+    "c_00101_00250": 175,
+    "c_00251_00500": 375,
+    "c_00501_01000": 750,
+    "c_01001_05000": 3000,
+    "c_05001_10000": 7500,
+    "c_10001_max": 15000,
+})
+
+# Per-source fields that merge_company_data never copies between records
+MERGE_SKIP_KEYS = frozenset({"source", "raw_data"})
+
 
 class DataNormalizer:
     """Normalize data from different sources into unified schema"""
@@ -47,7 +87,7 @@ class DataNormalizer:
                 "phone": apollo_org.get("phone"),
                 "founded_year": apollo_org.get("founded_year"),
                 "source": "Apollo",
-                "raw_data": apollo_org
+                "raw_data": DataNormalizer._raw_data(apollo_org)
             }
         except Exception as e:
             logger.error(f"Failed to normalize Apollo organization: {str(e)}")
@@ -67,8 +107,11 @@ class DataNormalizer:
         try:
             # Get email
             email = apollo_person.get("email")
-            if not email and "email_guesses" in apollo_person:
-                email = apollo_person["email_guesses"][0] if apollo_person["email_guesses"] else None
+            if not email:
+                email_guesses = apollo_person.get("email_guesses")
+                email = email_guesses[0] if email_guesses else None
+            
+            phone_numbers = apollo_person.get("phone_numbers")
             
             return {
                 "name": f"{apollo_person.get('first_name', '')} {apollo_person.get('last_name', '')}".strip(),
@@ -77,11 +120,11 @@ class DataNormalizer:
                 "title": apollo_person.get("title"),
                 "email": email,
                 "linkedin_url": apollo_person.get("linkedin_url"),
-                "phone": apollo_person.get("phone_numbers", [{}])[0].get("raw_number") if apollo_person.get("phone_numbers") else None,
+                "phone": phone_numbers[0].get("raw_number") if phone_numbers else None,
                 "seniority": apollo_person.get("seniority"),
                 "departments": apollo_person.get("departments", []),
                 "source": "Apollo",
-                "raw_data": apollo_person
+                "raw_data": DataNormalizer._raw_data(apollo_person)
             }
         except Exception as e:
             logger.error(f"Failed to normalize Apollo person: {str(e)}")
@@ -99,55 +142,80 @@ class DataNormalizer:
             Normalized company dict
         """
         try:
+            value = DataNormalizer._cb_value
+            
             # Extract domain
-            domain = cb_org.get("website", {}).get("value", "")
+            domain = value(cb_org, "website", "")
             if domain:
                 domain = DataNormalizer._clean_domain(domain)
             
             # Get categories (industries)
-            categories = cb_org.get("categories", [])
+            categories = cb_org.get("categories") or []
             industry = categories[0].get("value") if categories else None
             
             # Get location
-            locations = cb_org.get("location_identifiers", [])
+            locations = cb_org.get("location_identifiers") or []
             location = locations[0].get("value") if locations else None
             
-            # Parse revenue range
-            revenue_range = cb_org.get("revenue_range", {}).get("value")
-            revenue = DataNormalizer._parse_crunchbase_revenue(revenue_range)
-            
-            # Parse employee count
-            employee_range = cb_org.get("num_employees_enum", {}).get("value")
-            employee_count = DataNormalizer._parse_crunchbase_employees(employee_range)
+            # Parse revenue and employee ranges
+            revenue = DataNormalizer._parse_crunchbase_revenue(value(cb_org, "revenue_range"))
+            employee_count = DataNormalizer._parse_crunchbase_employees(value(cb_org, "num_employees_enum"))
             
             # Funding info
-            funding_total = cb_org.get("funding_total", {})
+            funding_total = cb_org.get("funding_total")
             funding_amount = funding_total.get("value_usd") if isinstance(funding_total, dict) else None
             
+            # Founded date is "YYYY-MM-DD"; keep the year
+            founded_on = value(cb_org, "founded_on")
+            
             return {
-                "company_name": cb_org.get("name", {}).get("value", ""),
+                "company_name": value(cb_org, "name", ""),
                 "domain": domain,
                 "revenue": revenue,
                 "employee_count": employee_count,
                 "industry": industry,
                 "location": location,
-                "description": cb_org.get("short_description", {}).get("value", ""),
-                "funding_stage": cb_org.get("last_funding_type", {}).get("value"),
+                "description": value(cb_org, "short_description", ""),
+                "funding_stage": value(cb_org, "last_funding_type"),
                 "funding_total": funding_amount,
-                "founded_year": cb_org.get("founded_on", {}).get("value", "").split("-")[0] if cb_org.get("founded_on") else None,
-                "ipo_status": cb_org.get("ipo_status", {}).get("value"),
+                "founded_year": founded_on.split("-", 1)[0] if founded_on else None,
+                "ipo_status": value(cb_org, "ipo_status"),
                 "source": "Crunchbase",
-                "raw_data": cb_org
+                "raw_data": DataNormalizer._raw_data(cb_org)
             }
         except Exception as e:
             logger.error(f"Failed to normalize Crunchbase organization: {str(e)}")
             return {}
     
     @staticmethod
+    def _cb_value(cb_org: Dict[str, Any], field: str, default: Any = None) -> Any:
+        """Read a Crunchbase field with a single lookup, unwrapping {"value": ...} fields"""
+        field_value = cb_org.get(field)
+        if isinstance(field_value, dict):
+            return field_value.get("value", default)
+        return default if field_value is None else field_value
+    
+    @staticmethod
+    def _raw_data(data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Raw API payload to keep on a normalized record
+        
+        Nothing downstream reads raw_data, and keeping full responses bloats
+        every prospect (contacts included) in memory and in saved results,
+        so it is only kept when debug logging is on.
+        """
+        return data if logger.isEnabledFor(logging.DEBUG) else None
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
     def _clean_domain(url: str) -> str:
-        """Extract clean domain from URL"""
+        """Extract clean domain from URL (memoized, the same sites recur across sources)"""
+        # A bare "name.tld" is already clean; skip the suffix-list lookup
+        if _BARE_DOMAIN_RE.match(url):
+            return url
+        
         try:
-            extracted = tldextract.extract(url)
+            extracted = _extract_domain(url)
             return f"{extracted.domain}.{extracted.suffix}"
         except Exception:
             return url.replace("http://", "").replace("https://", "").replace("www.", "").split("/")[0]
@@ -166,16 +234,7 @@ class DataNormalizer:
         if not revenue_range:
             return None
         
-        revenue_map = {
-            "r_00000000": 0,
-            "r_00001000": 500000,
-            "r_00010000": 5000000,
-            "r_00100000": 50000000,
-            "r_01000000": 500000000,
-            "r_10000000": 5000000000,
-        }
-        
-        return revenue_map.get(revenue_range)
+        return CRUNCHBASE_REVENUE_MAP.get(revenue_range)
     
     @staticmethod
     def _parse_crunchbase_employees(employee_range: Optional[str]) -> Optional[int]:
@@ -183,19 +242,7 @@ class DataNormalizer:
         if not employee_range:
             return None
         
-        employee_map = {
-            "c_00001_00010": 5,
-            "c_00011_00050": 30,
-            "c_00051_00100": 75,
-            "c_00101_00250": 175,
-            "c_00251_00500": 375,
-            "c_00501_01000": 750,
-            "c_01001_05000": 3000,
-            "c_05001_10000": 7500,
-            "c_10001_max": 15000,
-        }
-        
-        return employee_map.get(employee_range)
+        return CRUNCHBASE_EMPLOYEE_MAP.get(employee_range)
     
     @staticmethod
     def merge_company_data(
@@ -212,29 +259,31 @@ class DataNormalizer:
         Returns:
             List of merged company dicts
         """
+        # Single pass keyed on primary_key, so merging is linear in the input
         merged = {}
         
         for company in companies:
-            key_value = company.get(primary_key, "").lower().strip()
+            key_value = (company.get(primary_key) or "").lower().strip()
             if not key_value:
                 continue
             
-            if key_value not in merged:
+            existing = merged.get(key_value)
+            if existing is None:
                 merged[key_value] = company.copy()
                 merged[key_value]["sources"] = [company.get("source")]
-            else:
-                # Merge data, preferring non-None values
-                existing = merged[key_value]
-                sources = existing.get("sources", [])
-                sources.append(company.get("source"))
-                
-                for key, value in company.items():
-                    if key in ["source", "raw_data"]:
-                        continue
-                    
-                    if value is not None and (existing.get(key) is None or value != ""):
-                        existing[key] = value
+                continue
+            
+            # Merge data, preferring non-None values
+            for key, value in company.items():
+                if key in MERGE_SKIP_KEYS:
+                    continue
                 
-                existing["sources"] = list(set(sources))  # Deduplicate sources
+                if value is not None and (existing.get(key) is None or value != ""):
+                    existing[key] = value
+            
+            # Record each source once, in the order first seen
+            source = company.get("source")
+            if source not in existing["sources"]:
+                existing["sources"].append(source)
         
         return list(merged.values())
@@ -34,6 +34,15 @@ class MockDataGenerator:
     
     CITIES = ["San Francisco", "New York", "Austin", "Seattle", "Boston", "Chicago"]
     
+    # Funding total range (USD) for each stage
+    FUNDING_RANGES = {
+        "Seed": (1000000, 5000000),
+        "Series A": (5000000, 20000000),
+        "Series B": (20000000, 50000000),
+        "Series C": (50000000, 150000000),
+    }
+    FUNDING_STAGES = list(FUNDING_RANGES)
+    
     @staticmethod
     def generate_companies(count: int = 10, icp_filter: Dict[str, Any] = None) -> List[Dict[str, Any]]:
         """Generate mock company data matching ICP"""
@@ -91,19 +100,12 @@ class MockDataGenerator:
     @staticmethod
     def generate_funding_data(company_name: str) -> Dict[str, Any]:
         """Generate mock funding data"""
-        stages = ["Seed", "Series A", "Series B", "Series C"]
-        stage = random.choice(stages)
-        
-        funding_map = {
-            "Seed": random.randint(1000000, 5000000),
-            "Series A": random.randint(5000000, 20000000),
-            "Series B": random.randint(20000000, 50000000),
-            "Series C": random.randint(50000000, 150000000),
-        }
+        stage = random.choice(MockDataGenerator.FUNDING_STAGES)
+        low, high = MockDataGenerator.FUNDING_RANGES[stage]
         
         return {
             "last_funding_type": stage,
-            "funding_total": funding_map[stage],
+            "funding_total": random.randint(low, high),
             "last_funding_at": "2024-06-15",
             "has_funding": True
         }
@@ -1,14 +1,67 @@
 """
 Scoring and deduplication logic for prospect data
 """
+import functools
 import logging
-from typing import List, Dict, Any, Set
-from difflib import SequenceMatcher
+from typing import List, Dict, Any, Set, Tuple
 import re
+from rapidfuzz import fuzz, process
 
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=64)
+def _compile_keyword_matcher(keywords: Tuple[str, ...]):
+    """
+    Build a single-pass matcher for a list of keywords
+    
+    Memoized on the keyword tuple, so scorers built for the same ICP (one per
+    search) share one compiled pattern.
+    
+    Returns a regex that finds, at every position of a text, the longest
+    keyword starting there, plus a map from each keyword to the keywords it
+    contains. Together they give the same matches as testing
+    `keyword in text` for every keyword, with one scan of the text.
+    """
+    unique = sorted(set(keywords), key=len, reverse=True)
+    if not unique:
+        return None, {}
+    
+    pattern = re.compile("(?=(" + "|".join(re.escape(k) for k in unique) + "))")
+    implies = {k: frozenset(other for other in unique if other in k) for k in unique}
+    return pattern, implies
+
+
+_COMPANY_SUFFIX_RE = re.compile(r"(?:[\s,]+(?:inc|llc|ltd|co|corp|gmbh|sa|plc)\.?)+$")
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+_GMAIL_TAG_RE = re.compile(r"^([^+@]+)\+[^@]*(@gmail\.com)$")
+
+
+def _canonical_company_name(name: str) -> str:
+    """Lowercased company name without legal suffixes, punctuation or extra spaces"""
+    name = _COMPANY_SUFFIX_RE.sub("", name.lower().strip())
+    return " ".join(_NON_ALNUM_RE.sub(" ", name).split())
+
+
+def _similar_length_window(length: int, threshold: float):
+    """
+    Range of string lengths that can reach `threshold` similarity with a
+    string of `length`
+    
+    fuzz.ratio() / 100 is at most 2 * min(len_a, len_b) / (len_a + len_b),
+    so strings outside this window can never match. The window is widened by a
+    tiny margin to stay safe against float rounding.
+    """
+    if threshold <= 0:
+        return 0, float("inf")
+    
+    margin = 1e-9
+    return (
+        length * threshold / (2 - threshold) - margin,
+        length * (2 - threshold) / threshold + margin
+    )
+
+
 class ProspectScorer:
     """Calculate confidence scores for prospects based on ICP match"""
     
@@ -24,6 +77,21 @@ class ProspectScorer:
         self.icp_industries = [i.lower() for i in self.icp.get("industry", [])]
         self.icp_keywords = [k.lower() for k in self.icp.get("keywords", [])]
         self.icp_tech_stack = [t.lower() for t in self.signals.get("tech_stack", [])]
+        self.icp_tech_stack_set = frozenset(self.icp_tech_stack)
+        self._keyword_re, self._keyword_implies = _compile_keyword_matcher(tuple(self.icp_keywords))
+        
+        # Fixed ICP bounds and signal requirements, read once rather than per company
+        self.rev_min = self.icp.get("revenue_min", 0)
+        self.rev_max = self.icp.get("revenue_max", float("inf"))
+        self.emp_min = self.icp.get("employee_count_min", 0)
+        self.emp_max = self.icp.get("employee_count_max", float("inf"))
+        self.requires_funding = bool(self.signals.get("funding"))
+        self.requires_hiring = bool(self.signals.get("hiring_data_roles"))
+        
+        # Many companies share an industry or tech stack, and the ICP is fixed
+        # for the scorer's lifetime, so memoize those scores per scorer
+        self._industry_score_cached = functools.lru_cache(maxsize=4096)(self._industry_score)
+        self._tech_stack_score_cached = functools.lru_cache(maxsize=4096)(self._tech_stack_score)
     
     def calculate_score(
         self,
@@ -76,13 +144,23 @@ class ProspectScorer:
         if not company_industry or not self.icp_industries:
             return 0.5  # Neutral score if no data
         
+        return self._industry_score_cached(company_industry)
+    
+    def _industry_score(self, company_industry: str) -> float:
+        """Score a lowercased company industry against the ICP industries (uncached)"""
+        # Only industries of a comparable length can pass the fuzzy threshold
+        min_length, max_length = _similar_length_window(len(company_industry), 0.6)
+        
         # Check for exact or partial match
         for icp_industry in self.icp_industries:
             if icp_industry in company_industry or company_industry in icp_industry:
                 return 1.0
             
+            if not min_length <= len(icp_industry) <= max_length:
+                continue
+            
             # Fuzzy match
-            similarity = SequenceMatcher(None, icp_industry, company_industry).ratio()
+            similarity = fuzz.ratio(icp_industry, company_industry) / 100
             if similarity > 0.6:
                 return similarity
         
@@ -96,8 +174,8 @@ class ProspectScorer:
         # Revenue check
         revenue = company.get("revenue")
         if revenue and isinstance(revenue, (int, float)):
-            rev_min = self.icp.get("revenue_min", 0)
-            rev_max = self.icp.get("revenue_max", float("inf"))
+            rev_min = self.rev_min
+            rev_max = self.rev_max
             
             if rev_min <= revenue <= rev_max:
                 score += 1.0
@@ -111,8 +189,8 @@ class ProspectScorer:
         # Employee count check
         employee_count = company.get("employee_count")
         if employee_count and isinstance(employee_count, (int, float)):
-            emp_min = self.icp.get("employee_count_min", 0)
-            emp_max = self.icp.get("employee_count_max", float("inf"))
+            emp_min = self.emp_min
+            emp_max = self.emp_max
             
             if emp_min <= employee_count <= emp_max:
                 score += 1.0
@@ -137,12 +215,16 @@ class ProspectScorer:
         if not self.icp_keywords:
             return 0.5
         
-        matches = sum(1 for keyword in self.icp_keywords if keyword in text)
+        found = set()
+        for match in self._keyword_re.finditer(text):
+            found |= self._keyword_implies[match.group(1)]
+        
+        matches = sum(1 for keyword in self.icp_keywords if keyword in found)
         return matches / len(self.icp_keywords)
     
     def _score_funding(self, signals: Dict[str, Any]) -> float:
         """Score funding signals"""
-        if not self.signals.get("funding"):
+        if not self.requires_funding:
             return 0.5  # Neutral if not required
         
         has_funding = signals.get("new_funding", False)
@@ -154,7 +236,7 @@ class ProspectScorer:
     
     def _score_hiring(self, signals: Dict[str, Any]) -> float:
         """Score hiring signals"""
-        if not self.signals.get("hiring_data_roles"):
+        if not self.requires_hiring:
             return 0.5
         
         recent_hiring = signals.get("recent_hiring", False)
@@ -171,13 +253,16 @@ class ProspectScorer:
         if not self.icp_tech_stack:
             return 0.5
         
-        company_tech = [t.lower() for t in signals.get("tech_stack", [])]
+        company_tech = frozenset(t.lower() for t in signals.get("tech_stack", []))
         
         if not company_tech:
             return 0.5
         
-        matches = sum(1 for tech in self.icp_tech_stack if tech in company_tech)
-        return matches / len(self.icp_tech_stack)
+        return self._tech_stack_score_cached(company_tech)
+    
+    def _tech_stack_score(self, company_tech: frozenset) -> float:
+        """Fraction of the ICP tech stack found in a company's tech (uncached)"""
+        return len(self.icp_tech_stack_set & company_tech) / len(self.icp_tech_stack_set)
 
 
 class Deduplicator:
@@ -202,32 +287,51 @@ class Deduplicator:
             return []
         
         unique_companies = []
-        seen_domains: Set[str] = set()
-        seen_names: List[str] = []
+        seen_keys: Set[str] = set()
+        # Kept names blocked by length, so a new name is only compared
+        # against names of a length that could reach the threshold
+        seen_by_length: Dict[int, List[str]] = {}
+        seen_canonical: Set[str] = set()
         
         for company in companies:
             domain = (company.get("domain") or "").lower().strip()
             name = (company.get("company_name") or "").lower().strip()
             
-            # Check domain
-            if domain and domain in seen_domains:
+            # Exact match on domain, or on name for companies without a domain
+            key = domain or name
+            if key and key in seen_keys:
+                continue
+            
+            # Names equal once legal suffixes and punctuation are dropped
+            # ("Acme, Inc." / "Acme Inc") are duplicates without fuzzy matching
+            canonical = _canonical_company_name(name)
+            if canonical and canonical in seen_canonical:
                 continue
             
             # Check name similarity
             is_duplicate = False
             if name:
-                for seen_name in seen_names:
-                    similarity = SequenceMatcher(None, name, seen_name).ratio()
-                    if similarity >= threshold:
-                        is_duplicate = True
-                        break
+                min_length, max_length = _similar_length_window(len(name), threshold)
+                candidates = [
+                    seen_name
+                    for length, names in seen_by_length.items()
+                    if min_length <= length <= max_length
+                    for seen_name in names
+                ]
+                if candidates:
+                    # One call scores every candidate inside rapidfuzz's C++ kernel
+                    is_duplicate = process.extractOne(
+                        name, candidates, scorer=fuzz.ratio, score_cutoff=threshold * 100
+                    ) is not None
             
             if not is_duplicate:
                 unique_companies.append(company)
-                if domain:
-                    seen_domains.add(domain)
+                if key:
+                    seen_keys.add(key)
+                if canonical:
+                    seen_canonical.add(canonical)
                 if name:
-                    seen_names.append(name)
+                    seen_by_length.setdefault(len(name), []).append(name)
         
         logger.info(f"Deduplicated {len(companies)} companies to {len(unique_companies)}")
         return unique_companies
@@ -282,11 +386,5 @@ class Deduplicator:
         if not email:
             return ""
         
-        email = email.lower().strip()
         # Remove +tags from gmail addresses
-        if "@gmail.com" in email:
-            local, domain = email.split("@")
-            local = local.split("+")[0]
-            email = f"{local}@{domain}"
-        
-        return email
+        return _GMAIL_TAG_RE.sub(r"\1\2", email.lower().strip())
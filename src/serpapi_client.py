@@ -3,22 +3,37 @@ SerpAPI Client for job postings and hiring signals
 Free tier: 100 searches/month
 API Docs: https://serpapi.com/search-api
 """
+import functools
 import logging
+import re
 from typing import List, Dict, Any, Optional
 from .api_client_base import BaseAPIClient
 
 logger = logging.getLogger(__name__)
 
+# Keywords that indicate data-related roles, matched anywhere in a job title
+DATA_ROLE_KEYWORDS = (
+    "data", "analytics", "scientist", "engineer",
+    "machine learning", "ml", "ai", "artificial intelligence"
+)
+DATA_ROLE_RE = re.compile("|".join(re.escape(keyword) for keyword in DATA_ROLE_KEYWORDS))
+
 
 class SerpAPIClient(BaseAPIClient):
     """Client for SerpAPI - Google Jobs scraping"""
     
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, calls_per_minute: int = 20, bypass_cache: bool = False):
         super().__init__(
             api_key=api_key,
             base_url="https://serpapi.com",
-            calls_per_minute=20
+            calls_per_minute=calls_per_minute,
+            bypass_cache=bypass_cache
         )
+        
+        # Each search spends a credit from a small monthly quota, so repeat
+        # searches for the same company are answered from memory. Failed
+        # searches raise inside the cached call and are not stored.
+        self._search_jobs_cached = functools.lru_cache(maxsize=1024)(self._request_jobs)
     
     def search_jobs(
         self,
@@ -37,6 +52,23 @@ class SerpAPIClient(BaseAPIClient):
         Returns:
             Dict with job results and signals
         """
+        try:
+            return self._search_jobs_cached(
+                company_name.strip().lower(),
+                tuple(job_titles or ()),
+                location
+            )
+        except Exception as e:
+            logger.error(f"SerpAPI job search failed for {company_name}: {str(e)}")
+            return {
+                "jobs_found": 0,
+                "data_roles_count": 0,
+                "recent_postings": [],
+                "hiring_signal": False
+            }
+    
+    def _request_jobs(self, company_name: str, job_titles: tuple, location: str) -> Dict[str, Any]:
+        """Fetch and parse job postings from the API (uncached)"""
         # Build search query
         query = f"{company_name}"
         if job_titles:
@@ -50,50 +82,27 @@ class SerpAPIClient(BaseAPIClient):
             "num": 10  # Limit results to save credits
         }
         
-        try:
-            response = self._make_request(
-                method="GET",
-                endpoint="/search",
-                params=params
-            )
-            
-            return self._parse_job_results(response)
-            
-        except Exception as e:
-            logger.error(f"SerpAPI job search failed for {company_name}: {str(e)}")
-            return {
-                "jobs_found": 0,
-                "data_roles_count": 0,
-                "recent_postings": [],
-                "hiring_signal": False
-            }
+        response = self._make_request(
+            method="GET",
+            endpoint="/search",
+            params=params
+        )
+        return self._parse_job_results(response)
     
     def _parse_job_results(self, response: Dict[str, Any]) -> Dict[str, Any]:
         """Parse SerpAPI response into structured hiring signals"""
         jobs = response.get("jobs_results", [])
+        search_data_role = DATA_ROLE_RE.search
         
-        # Keywords that indicate data-related roles
-        data_keywords = [
-            "data", "analytics", "scientist", "engineer", 
-            "machine learning", "ml", "ai", "artificial intelligence"
-        ]
-        
-        data_roles_count = 0
-        recent_postings = []
-        
-        for job in jobs[:10]:  # Limit to first 10
-            title = job.get("title", "").lower()
-            
-            # Check if it's a data role
-            is_data_role = any(keyword in title for keyword in data_keywords)
-            if is_data_role:
-                data_roles_count += 1
-            
-            recent_postings.append({
+        recent_postings = [
+            {
                 "title": job.get("title"),
-                "posted_at": job.get("detected_extensions", {}).get("posted_at"),
-                "is_data_role": is_data_role
-            })
+                "posted_at": (job.get("detected_extensions") or {}).get("posted_at"),
+                "is_data_role": search_data_role((job.get("title") or "").lower()) is not None
+            }
+            for job in jobs[:10]  # Limit to first 10
+        ]
+        data_roles_count = sum(posting["is_data_role"] for posting in recent_postings)
         
         return {
             "jobs_found": len(jobs),
@@ -151,3 +160,9 @@ class SerpAPIClient(BaseAPIClient):
         except Exception as e:
             logger.error(f"SerpAPI news search failed for {company_name}: {str(e)}")
             return []
+    
+    def close(self):
+        """Log job search cache usage and close the session"""
+        jobs_info = self._search_jobs_cached.cache_info()
+        logger.info(f"SerpAPI job search cache - {jobs_info.hits} hits / {jobs_info.misses} misses")
+        super().close()
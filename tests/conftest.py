@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# Make run_agent and the src package importable from the tests
+sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -0,0 +1,52 @@
+"""
+Tests for ProspectSearchAgent contact lookups
+"""
+import pytest
+
+from src.agent import ProspectSearchAgent
+
+
+class FakeApollo:
+    def __init__(self, people):
+        self.people = people
+        self.calls = []
+    
+    def search_people(self, titles=None, per_page=25):
+        self.calls.append({"titles": titles, "per_page": per_page})
+        return {"people": self.people}
+
+
+def _person(i):
+    return {
+        "first_name": f"First{i}",
+        "last_name": f"Last{i}",
+        "title": "Head of Data",
+        "email": f"person{i}@acme.com",
+    }
+
+
+@pytest.fixture
+def agent(monkeypatch):
+    for key in ("APOLLO_API_KEY", "CRUNCHBASE_API_KEY", "SERP_API_KEY"):
+        monkeypatch.delenv(key, raising=False)
+    return ProspectSearchAgent()
+
+
+def test_fetch_contacts_keeps_partial_apollo_results(agent):
+    agent.apollo = FakeApollo([_person(1), _person(2)])
+    company = {"company_name": "Acme", "domain": "acme.com"}
+    
+    contacts = agent._fetch_contacts(company, ["Head of Data"], max_contacts=5)
+    
+    # Fewer people than max_contacts are kept as they are, not padded with mock contacts
+    assert [c["email"] for c in contacts] == ["person1@acme.com", "person2@acme.com"]
+    assert agent.apollo.calls == [{"titles": ["Head of Data"], "per_page": 5}]
+
+
+def test_fetch_contacts_stops_at_max_contacts(agent):
+    agent.apollo = FakeApollo([_person(i) for i in range(8)])
+    company = {"company_name": "Acme", "domain": "acme.com"}
+    
+    contacts = agent._fetch_contacts(company, [], max_contacts=3)
+    
+    assert len(contacts) == 3
@@ -0,0 +1,58 @@
+"""
+Tests for batch mode in run_agent
+"""
+import run_agent
+
+
+def test_output_paths_keep_unique_stems():
+    assert run_agent._output_paths(["config/saas.yaml", "config/fintech.json"]) == [
+        "output/saas_prospects.json",
+        "output/fintech_prospects.json",
+    ]
+
+
+def test_output_paths_number_colliding_stems():
+    paths = run_agent._output_paths(["a.yaml", "a.json", "x/icp.yaml", "y/icp.yaml"])
+    
+    assert paths == [
+        "output/a_prospects.json",
+        "output/a_2_prospects.json",
+        "output/icp_prospects.json",
+        "output/icp_2_prospects.json",
+    ]
+
+
+def test_output_paths_skip_names_taken_by_other_stems():
+    paths = run_agent._output_paths(["a.yaml", "a_2.yaml", "a.json"])
+    
+    assert len(set(paths)) == 3
+
+
+def test_run_batch_saves_each_icp_separately(monkeypatch):
+    saved = {}
+    
+    class FakeAgent:
+        def fork(self):
+            return FakeAgent()
+        
+        def load_icp(self, icp_path):
+            self.icp_path = icp_path
+        
+        def search_prospects(self):
+            return [{"icp": self.icp_path}]
+        
+        def save_results(self, prospects, output_path):
+            saved[output_path] = prospects
+        
+        def close(self):
+            pass
+    
+    monkeypatch.setattr(run_agent, "ProspectSearchAgent", FakeAgent)
+    
+    results = run_agent.run_batch(["x/icp.yaml", "y/icp.yaml"], max_workers=2)
+    
+    assert results == [[{"icp": "x/icp.yaml"}], [{"icp": "y/icp.yaml"}]]
+    assert saved == {
+        "output/icp_prospects.json": [{"icp": "x/icp.yaml"}],
+        "output/icp_2_prospects.json": [{"icp": "y/icp.yaml"}],
+    }